@@ -64,21 +64,57 @@ Example Usage:
 import os
 import re
 import sys
+import stat
 import time
-import inspect
 import logging
+import queue
 import platform
 import datetime
 import asyncio
 from enum import Enum
+from array import array
+from functools import lru_cache
+from itertools import islice
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
-from collections import deque
+from collections import deque, OrderedDict
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
-from asyncio import Lock as AsyncLock
-from typing import Optional, Dict, List, Tuple, Any, Union, Literal, Deque
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+from typing import (
+    Optional, Dict, List, Tuple, Any, Union, Literal, Deque, Iterator, Callable, Sequence
+)
 
 
+# // ========================================( Constants )======================================== // #
+
+
+# Matches color/style tags such as `<red>` or `<blue+bold>` in format strings and messages
+_TAG_RE = re.compile(r'<([^<>]+)>')
+
+# Control characters escaped in log text, applied in a single translate pass
+_CONTROL_CHAR_TRANSLATION = str.maketrans({'\0': ' ', '\n': '⏎', '\r': '⏎'})
+
+# Runs of two or more spaces, collapsed to one when normalizing log text
+_MULTI_SPACE_RE = re.compile(r' {2,}')
+
+# Texts up to this length go through the normalization cache; longer ones bypass it
+_CACHEABLE_TEXT_LENGTH = 256
+
+# Dict messages and values render at most this many items before summarizing the rest
+_MAX_DICT_ITEMS = 64
+
+# Characters not allowed in extras keys, replaced with underscores
+_UNSAFE_KEY_RE = re.compile(r'[^a-zA-Z0-9_.-]')
+
+# _UNSAFE_KEY_RE as a translation table, applied in C for ASCII keys
+_KEY_TRANSLATION = str.maketrans({
+    i: '_' for i in range(128) if not (chr(i).isalnum() or chr(i) in '_.-')
+})
+
+# Name of the current logging context, shown in the funcName field; tasks inherit a copy
+_CONTEXT_NAME: ContextVar[str] = ContextVar('asynclogger_context', default='main')
+
 # // ========================================( Exceptions )======================================== // #
 
 
@@ -195,10 +231,12 @@ class LoggerMetrics:
 # // ========================================( Classes )======================================== // #
 
 
+@lru_cache(maxsize=1)
 def detect_color_support() -> bool:
     """
     Determines if the current environment supports color output.
     Considers IDE overrides, system environment variables, and platform.
+    The result is computed once per process and cached thereafter.
 
     Returns:
         bool: True if color output is likely supported, False otherwise.
@@ -241,6 +279,57 @@ def detect_color_support() -> bool:
     return False
 
 
+@lru_cache(maxsize=256)
+def _center_context(name: str) -> str:
+    """
+    Centers a context name in the 17-character funcName column.
+    The set of context names is small, so each padded string is built once.
+    """
+    return f"{name:^17}"
+
+
+def _normalize_text(text: str) -> str:
+    """
+    Makes a string log-safe by escaping control characters and spacing.
+    Null bytes become spaces, newlines become '⏎', and runs of spaces collapse.
+    """
+    text = text.translate(_CONTROL_CHAR_TRANSLATION)
+    return _MULTI_SPACE_RE.sub(' ', text).strip(' ')
+
+
+# Short messages and extras values repeat heavily, so their normalization is cached
+_normalize_short_text = lru_cache(maxsize=1024)(_normalize_text)
+
+
+def _join_dict_items(mapping: Dict[Any, Any]) -> str:
+    """
+    Renders a dict as 'k=v' pairs joined by commas, in a single pass.
+    Items past _MAX_DICT_ITEMS are not stringified, only counted in a suffix.
+    """
+    joined = ', '.join(f"{k}={v}" for k, v in islice(mapping.items(), _MAX_DICT_ITEMS))
+    if len(mapping) > _MAX_DICT_ITEMS:
+        joined += f", ...+{len(mapping) - _MAX_DICT_ITEMS} more"
+    return joined
+
+
+@lru_cache(maxsize=4096)
+def _normalize_key(key: str, max_len: int) -> str:
+    """
+    Makes an extras key safe: unsafe characters become '_', a leading '_'
+    gets an 'x' prefix, and keys over max_len are truncated with '...'.
+    Extras schemas repeat across calls, so each key is normalized once.
+    """
+    if key.isascii():
+        key = key.translate(_KEY_TRANSLATION)
+    else:
+        key = _UNSAFE_KEY_RE.sub('_', key)
+    if key.startswith('_'):
+        key = 'x' + key
+    if len(key) > max_len:
+        key = key[:max_len - 3] + '...'
+    return key
+
+
 class ANSIColors(Enum):
     """
     Defines ANSI color and style codes for decorating terminal output.
@@ -328,13 +417,28 @@ class ANSIColors(Enum):
             # Get bold blue color
             bold_blue = ANSIColors.get('blue+bold')
         """
+        code = cls._resolve(name)
+        if code is None:
+            raise ValueError(f"Color or style '{name}' not found")
+        return code
+
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _resolve(cls, name: str) -> Optional[str]:
+        """
+        Resolves a readable color name to its ANSI code, or None if unknown.
+        Results are cached so each distinct tag is only parsed once.
+        """
+        code = _ANSI_COMBOS.get(name)
+        if code is not None:
+            return code
         try:
             if '+' in name:
                 return ''.join(cls[part.strip().upper()].value
                                for part in name.split('+'))
             return cls[name.strip().upper()].value
         except KeyError:
-            raise ValueError(f"Color or style '{name}' not found")
+            return None
 
     @classmethod
     def format(cls, message: str, level_color: Optional[str] = None) -> str:
@@ -351,24 +455,22 @@ class ANSIColors(Enum):
             )
             print(f"{colorized}")
         """
-        result = message
-        used_codes = []
-        if level_color:
-            try:
-                color_code = cls.get(level_color)
-                result = result.replace("<level_color>", color_code)
-                used_codes.append(color_code)
-            except ValueError:
-                pass
-        tags = re.findall(r'<([^>]+)>', result)
-        for tag in dict.fromkeys(tags):
-            if tag.lower() != "level_color":
-                try:
-                    code = cls.get(tag)
-                    result = result.replace(f'<{tag}>', code)
-                    used_codes.append(code)
-                except ValueError:
-                    pass
+        level_code = cls._resolve(level_color) if level_color else None
+        used_codes = level_code is not None
+
+        def substitute(match: re.Match) -> str:
+            nonlocal used_codes
+            tag = match.group(1)
+            if tag.lower() == "level_color":
+                code = level_code if tag == "level_color" else None
+            else:
+                code = cls._resolve(tag)
+            if code is None:
+                return match.group(0)
+            used_codes = True
+            return code
+
+        result = _TAG_RE.sub(substitute, message)
         if used_codes:
             result += cls.RESET.value
         return result
@@ -432,14 +534,24 @@ class LogFormatter(logging.Formatter):
                     Specified as int->str, e.g. {logging.INFO: 'white+bold'}
 
         Raises:
-            ValueError: If `style` arg is not one of %, {, or $
+            ValueError: If `style` arg is not one of %, {, or $, or if a
+                        level color name is not a known color or style
         """
         if style not in ("%", "{", "$"):
             raise ValueError("Style must be one of: %, {, or $")
         super().__init__(fmt, datefmt, style, validate)
         self.color_enabled = detect_color_support() if color_enabled is None else color_enabled
         self.colors = {**self.default_colors, **(colors or {})}
-        self._base_format = fmt
+        self._base_format = self._style._fmt
+        # The format string never changes, so resolve both variants up front
+        self._plain_fmt = _TAG_RE.sub('', self._base_format)
+        self._level_ansi: Dict[int, str] = {
+            level: ANSIColors.get(color) for level, color in self.colors.items()
+        }
+        self._colored_fmt_by_level: Dict[int, str] = {
+            level: self._base_format.replace('<level_color>', code)
+            for level, code in self._level_ansi.items()
+        }
 
     def format(self, record: logging.LogRecord) -> str:
         """
@@ -458,39 +570,205 @@ class LogFormatter(logging.Formatter):
         Returns:
             str: The formatted, colorized log message string
         """
-        # Save original values
-        orig_msg = record.msg
-        orig_levelname = record.levelname
         if self.color_enabled:
-            # Get the level color before any formatting
-            level_color = self.colors.get(record.levelno)
-            # Create a temporary format string with the level color replaced
-            if level_color:
-                temp_fmt = self._base_format.replace('<level_color>', ANSIColors.get(level_color))
-            else:
-                temp_fmt = self._base_format
-            # Set the temporary format
-            self._style._fmt = temp_fmt
-            # Apply standard formatting
-            formatted_msg = super().format(record)
-            # Apply remaining color formatting
-            formatted_msg = ANSIColors.format(formatted_msg)
-            # Restore the original format
-            self._style._fmt = self._base_format
+            # Use the format string prebuilt with this level's color, if any
+            self._style._fmt = self._colored_fmt_by_level.get(record.levelno, self._base_format)
+            # Apply standard formatting, then the remaining color tags
+            formatted_msg = ANSIColors.format(super().format(record))
         else:
-            # If colors are disabled, strip all color tags
-            temp_fmt = re.sub(r'<[^>]+>', '', self._base_format)
-            self._style._fmt = temp_fmt
+            # If colors are disabled, use the format with all color tags stripped
+            self._style._fmt = self._plain_fmt
             formatted_msg = super().format(record)
-            self._style._fmt = self._base_format
-
-        # Restore original values
-        record.msg = orig_msg
-        record.levelname = orig_levelname
+        # Restore the original format
+        self._style._fmt = self._base_format
 
         return formatted_msg
 
 
+# Default level color combinations, resolved once at import time
+_ANSI_COMBOS: Dict[str, str] = {
+    spec: ''.join(ANSIColors[part.strip().upper()].value for part in spec.split('+'))
+    for spec in LogFormatter.default_colors.values()
+}
+
+
+class BatchingRotatingFileHandler(RotatingFileHandler):
+    """
+    Rotating file handler that can write many records with one write call.
+
+    The stock RotatingFileHandler formats each record twice (once to check
+    for rollover and once to write it) and flushes the stream after every
+    record. This handler adds `emit_many`, which formats a whole batch once,
+    splits it only where a rollover is due, and issues one write per file
+    segment and one flush for the entire batch.
+
+    Also overrides `shouldRollover` so single-record emits format each
+    record once, reusing the rollover check's line for the write, and only
+    check the file type when a rollover is actually due.
+
+    With `durable=True` the file is opened with O_DSYNC, so each batch flush
+    returns only once the data is on stable storage, without a separate
+    fsync round-trip.
+
+    Inherits from the standard logging.handlers.RotatingFileHandler class.
+
+    Key methods:
+        emit_many: Write a batch of records in a single call.
+        shouldRollover: Exact size check that formats the record only once.
+
+    Example usage:
+        handler = BatchingRotatingFileHandler("app.log", maxBytes=1_048_576, delay=True)
+        handler.setFormatter(logging.Formatter("{message}", style="{"))
+        handler.emit_many(records)
+    """
+
+    # Most bytes a single character can take in the log file's encoding
+    MAX_BYTES_PER_CHAR = 4
+
+    # Falls back to plain appends on platforms without synchronous data writes
+    DURABLE_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, 'O_DSYNC', 0)
+
+    def __init__(self, *args: Any, durable: bool = False, **kwargs: Any):
+        """
+        Initializes a batching rotating file handler.
+
+        Args:
+            *args: Positional arguments for RotatingFileHandler
+            durable: Open the log file for synchronous data writes (O_DSYNC)
+            **kwargs: Keyword arguments for RotatingFileHandler
+        """
+        # Set before the base init, which opens the stream unless delayed
+        self.durable = durable
+        # (record, line) formatted by shouldRollover, reused by emit
+        self._formatted: Optional[Tuple[logging.LogRecord, str]] = None
+        super().__init__(*args, **kwargs)
+
+    def _open(self):
+        """
+        Open the current log file, with O_DSYNC when the handler is durable.
+
+        Returns:
+            The text stream to write log records to
+        """
+        if not self.durable:
+            return super()._open()
+        fd = os.open(self.baseFilename, self.DURABLE_FLAGS, 0o644)
+        return os.fdopen(fd, 'a', encoding=self.encoding, errors=self.errors)
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Format a record, reusing the line shouldRollover just formatted for it.
+
+        Args:
+            record: The log record to format
+
+        Returns:
+            str: The formatted record, without the terminator
+        """
+        formatted = self._formatted
+        if formatted is not None and formatted[0] is record:
+            return formatted[1]
+        return super().format(record)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Write a single record, rolling over first if needed.
+
+        Args:
+            record: The log record to write
+        """
+        try:
+            super().emit(record)
+        finally:
+            self._formatted = None
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        """
+        Determine if writing the record would push the file past maxBytes.
+
+        The stock implementation formats the record here and again when
+        writing it, and on older Pythons stats the file on every call. Here
+        the formatted line is kept for `emit` to reuse, it is only encoded
+        when its length at MAX_BYTES_PER_CHAR bytes per character could
+        reach the limit, and the file type is only checked when a rollover
+        is due. An empty file is never rolled over, so a single record larger
+        than maxBytes does not leave empty backups behind.
+
+        Args:
+            record: The log record about to be written
+
+        Returns:
+            bool: True if the file should be rolled over before writing
+        """
+        if self.stream is None:
+            self.stream = self._open()
+        if self.maxBytes <= 0:
+            return False
+        self.stream.seek(0, 2)
+        position = self.stream.tell()
+        if position == 0:
+            return False
+        line = super().format(record)
+        self._formatted = (record, line)
+        size = len(line) + len(self.terminator)
+        if position + size * self.MAX_BYTES_PER_CHAR < self.maxBytes:
+            return False
+        if position + len(f"{line}{self.terminator}".encode(self.stream.encoding)) < self.maxBytes:
+            return False
+        # Never rollover anything other than regular files
+        return os.path.isfile(self.baseFilename)
+
+    def emit_many(self, records: Sequence[logging.LogRecord]) -> None:
+        """
+        Write a batch of records to the log file, one write per file segment.
+
+        The batch is split wherever the next record would push the file past
+        maxBytes: everything before that point is written, the file is rolled
+        over, and writing continues in the new file.
+
+        Unlike `emit`, errors are not routed to `handleError`; they propagate
+        so the caller can account for the whole failed batch.
+
+        Args:
+            records: The log records to write, oldest first
+        """
+        if not records:
+            return
+        lines = [self.format(record) + self.terminator for record in records]
+        self.acquire()
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            rotate = self.maxBytes > 0
+            segment_start = 0
+            if rotate:
+                encoding = self.stream.encoding
+                self.stream.seek(0, 2)
+                position = self.stream.tell()
+                regular_file = None
+                for index, line in enumerate(lines):
+                    size = len(line.encode(encoding))
+                    if rotate and position and position + size >= self.maxBytes:
+                        # Never rollover anything other than regular files
+                        if regular_file is None:
+                            regular_file = os.path.isfile(self.baseFilename)
+                        if not regular_file:
+                            rotate = False
+                        else:
+                            self.stream.write(''.join(lines[segment_start:index]))
+                            self.doRollover()
+                            # Delayed handlers do not reopen the stream after rolling over
+                            if self.stream is None:
+                                self.stream = self._open()
+                            segment_start = index
+                            position = 0
+                    position += size
+            self.stream.write(''.join(lines[segment_start:]))
+            self.stream.flush()
+        finally:
+            self.release()
+
+
 class AsyncLogger:
     """
     A flexible asynchronous logger with color support and file rotation.
@@ -523,6 +801,9 @@ class AsyncLogger:
         warning: Log a message at WARNING level severity.
         error: Log a message at ERROR level severity.
         critical: Log a message at CRITICAL level severity.
+        context: Label messages logged within a block with a context name.
+        flush: Write batched file records to disk without waiting.
+        reset: Flush, then clear metrics, failed log entries and caches.
         shutdown: Cleanly shut down the logger, flushing all pending messages.
 
     Example usage:
@@ -534,7 +815,7 @@ class AsyncLogger:
     MAX_MESSAGE_LENGTH = 32768  # 32KB max message size
     MAX_KEY_LENGTH = 256  # Maximum length for extras keys
     MAX_VALUE_LENGTH = 1024  # Maximum length for extras values
-    UNSAFE_KEY_PATTERN = re.compile(r'[^a-zA-Z0-9_.-]')
+    UNSAFE_KEY_PATTERN = _UNSAFE_KEY_RE
 
     default_console_format: str = (
         "[<red>{asctime}<reset>] [<level_color>{levelname:<8}<reset>] "
@@ -552,17 +833,35 @@ class AsyncLogger:
         Use `AsyncLogger.create()` instead. This allows async operations
         during initialization to be handled properly.
         """
-        self._handler_lock = AsyncLock()
-        self._extras_cache = {}
+        self._extras_cache: OrderedDict[Tuple[Tuple[str, str], ...], str] = OrderedDict()
         self._cache_size = 1000
-        self._failed_logs: Deque[FailedLogEntry] = deque(maxlen=100)
+        # Prerendered log_template format strings, keyed by template id and
+        # whether the dynamic field is present; bounded like the extras cache
+        self._template_cache: OrderedDict[Tuple[str, bool], Tuple[str, bool, str]] = OrderedDict()
+        # Failed entries live in parallel ring-buffer slots; FailedLogEntry
+        # objects are only built when the entries are read back
+        self._failed_logs_size = 100
+        self._failed_count = 0
+        self._failed_timestamps = array('q', [0]) * self._failed_logs_size
+        self._failed_levels: List[Any] = [None] * self._failed_logs_size
+        self._failed_messages: List[Optional[str]] = [None] * self._failed_logs_size
+        self._failed_errors: List[Optional[str]] = [None] * self._failed_logs_size
         self.logger = None
         self.metrics = LoggerMetrics()
-        self._batch: List[logging.LogRecord] = []
+        self._listener: Optional[QueueListener] = None
+        self._file_handler: Optional[BatchingRotatingFileHandler] = None
+        self._stream_handlers: List[logging.Handler] = []
         self._batch_size = 100
+        self._max_pending = 8192
+        # Bounded as a safety net; log() writes inline before it can overflow
+        self._batch: Deque[logging.LogRecord] = deque(maxlen=self._max_pending)
         self._flush_interval = 5.0
-        self._last_flush = time.time()
+        self._last_flush = time.monotonic()
         self._flush_task = None
+        self._batch_pending = asyncio.Event()
+        self._batch_full = asyncio.Event()
+        # Keeps worker-thread batch writes in order, one at a time
+        self._write_lock = asyncio.Lock()
 
     @classmethod
     async def create(
@@ -576,6 +875,7 @@ class AsyncLogger:
             backup_count: int = 5,
             level: int = logging.DEBUG,
             colors: Optional[Dict[int, str]] = None,
+            durable: bool = False,
     ) -> 'AsyncLogger':
         """
         Factory method that creates and initializes an AsyncLogger instance.
@@ -593,6 +893,7 @@ class AsyncLogger:
             backup_count: Number of rotated files to keep
             level: The minimum logging level (e.g. logging.INFO)
             colors: Customize colors assigned to each log level
+            durable: Write log files with O_DSYNC so flushed batches survive a crash
 
         Returns:
             AsyncLogger: A fully configured AsyncLogger instance.
@@ -614,17 +915,57 @@ class AsyncLogger:
             console_handler = await instance._setup_console_handler(
                 console_format, color_enabled, colors
             )
-            instance.logger.addHandler(console_handler)
+            # Console records are only enqueued by the caller; formatting and
+            # terminal I/O happen on the listener's background thread
+            log_queue = queue.SimpleQueue()
+            instance.logger.addHandler(QueueHandler(log_queue))
+            instance._listener = QueueListener(
+                log_queue, console_handler, respect_handler_level=True
+            )
             if log_dir:
                 file_handler = await instance._setup_file_handler(
-                    log_dir, file_format, max_bytes, backup_count
+                    log_dir, file_format, max_bytes, backup_count, durable
                 )
                 instance.logger.addHandler(file_handler)
+            # Handler composition is fixed from here on, so partition it once
+            instance._stream_handlers = [
+                handler for handler in instance.logger.handlers
+                if handler is not instance._file_handler
+            ]
+            instance._listener.start()
             instance._flush_task = asyncio.create_task(instance._periodic_flush())
             return instance
         except Exception as e:
             raise LoggerConfigError(f"Failed to initialize logger: {str(e)}")
 
+    @classmethod
+    def create_no_io(cls, name: str, level: int = logging.DEBUG) -> 'AsyncLogger':
+        """
+        Create an AsyncLogger that performs no output.
+
+        The underlying logger only gets a NullHandler: no console listener
+        thread, log file or background flush task is set up. Messages still
+        go through validation, sanitization and metrics, so this suits tests
+        and benchmarks of the logging path itself.
+
+        Args:
+            name: A name for the logger
+            level: The minimum logging level (e.g. logging.INFO)
+
+        Returns:
+            AsyncLogger: An AsyncLogger instance that discards all records
+
+        Raises:
+            LoggerConfigError: If the logger name is invalid
+        """
+        if not isinstance(name, str) or not name.strip():
+            raise LoggerConfigError("Logger name must be a non-empty string")
+        instance = cls()
+        instance.logger = logging.getLogger(name)
+        instance.logger.setLevel(level)
+        instance.logger.handlers = [logging.NullHandler()]
+        return instance
+
     async def debug(self, msg: str, *args, extras: Optional[Dict[str, Any]] = None) -> None:
         """Log a message at the DEBUG severity level."""
         await self.log(logging.DEBUG, msg, *args, extras=extras)
@@ -645,6 +986,29 @@ class AsyncLogger:
         """Log a message at the CRITICAL severity level."""
         await self.log(logging.CRITICAL, msg, *args, extras=extras)
 
+    @contextmanager
+    def context(self, name: str) -> Iterator[None]:
+        """
+        Label all messages logged within the block with a context name.
+
+        The name replaces the default `main` in the funcName field of each
+        record. It is stored in a context variable, so it applies only to the
+        current task and is restored when the block exits.
+
+        Args:
+            name: The context name to attach to records, e.g. a task name
+
+        Example usage:
+            async def worker(logger: AsyncLogger, task_id: int):
+                with logger.context(f"Task-{task_id}"):
+                    await logger.info("Worker started")
+        """
+        token = _CONTEXT_NAME.set(name)
+        try:
+            yield
+        finally:
+            _CONTEXT_NAME.reset(token)
+
     async def log(self, level: int, msg: str, *args, extras: Optional[Dict[str, Any]] = None) -> None:
         """
         Log a message at the specified severity level.
@@ -652,6 +1016,10 @@ class AsyncLogger:
         Logs a message to all configured handlers (e.g. console, file) after
         performing validation and sanitization on the message and extras.
 
+        Messages below the logger's level are validated and counted, then
+        discarded before any sanitization or formatting work is done. This
+        includes levels below every named level, such as negative values.
+
         Automatically captures the caller's context (module, function, line).
         Records metrics on total messages logged and any errors.
         If an error occurs during the logging process itself, it is captured
@@ -662,7 +1030,6 @@ class AsyncLogger:
             msg: The main message string to be logged
             extras: Optional supplementary data to include in the log message
         """
-        frame = None
         caller_frame = None
         secured_msg = None
         try:
@@ -670,100 +1037,236 @@ class AsyncLogger:
             if msg is None:
                 # Explicitly record an error if the message is None
                 self.metrics.record_error()
-                # Create a failed log entry
-                failed_entry = FailedLogEntry(
-                    timestamp=datetime.datetime.now(),
-                    level=level,
-                    message='[empty message]',
-                    error='Attempted to log None message'
-                )
-                self._failed_logs.append(failed_entry)
+                self._record_failed_log(level, '[empty message]', 'Attempted to log None message')
                 msg = '[empty message]'
             if not isinstance(level, int):
                 raise ValueError("Log level must be an integer")
             # Record metrics
             self.metrics.record_message()
+            # Filtered levels skip sanitization, frame lookup and extras formatting
+            if not self.logger.isEnabledFor(level):
+                return
             # Secure message immediately
             secured_msg = self._secure_message(msg)
-            frame = inspect.currentframe()
-            if frame and frame.f_back:
-                caller_frame = frame.f_back.f_back
-                context_name = 'main'
-                try:
-                    loop = asyncio.get_running_loop()
-                    if loop.is_running():
-                        current_task = asyncio.current_task()
-                        if current_task:
-                            task_name = current_task.get_name()
-                            if task_name.startswith('Task-') and current_task._coro.__name__ == 'process_task':  # NOQA
-                                context_name = task_name
-                except RuntimeError:
-                    pass
-                context_name = f"{context_name:^17}"
-                formatted_msg = f"{secured_msg}{self._format_extras(extras)}"
-                async with self._handler_lock:
-                    old_func_name = self.logger.findCaller
-                    try:
-                        def get_caller_info(*args, **kwargs):
-                            return (
-                                caller_frame.f_code.co_filename,
-                                caller_frame.f_lineno,
-                                context_name,
-                                None
-                            )
-                        self.logger.findCaller = get_caller_info
-                        # Create the log record
-                        record = self.logger.makeRecord(
-                            self.logger.name, level,
-                            caller_frame.f_code.co_filename,
-                            caller_frame.f_lineno,
-                            formatted_msg, args, None,
-                            context_name
-                        )
-                        # Handle the record based on handler type
-                        for handler in self.logger.handlers:
-                            if isinstance(handler, RotatingFileHandler):
-                                self._batch.append(record)
-                                if len(self._batch) >= self._batch_size:
-                                    await self._flush_batch()
-                            else:
-                                handler.handle(record)
-                    finally:
-                        self.logger.findCaller = old_func_name
-            else:
-                async with self._handler_lock:
-                    formatted_msg = f"{secured_msg}{self._format_extras(extras)}"
-                    self.logger.log(level, formatted_msg, *args)
-
+            try:
+                # Skip this frame and the level convenience method that called it
+                caller_frame = sys._getframe(2)
+            except ValueError:
+                caller_frame = None
+            formatted_msg = f"{secured_msg}{self._format_extras(extras)}"
+            await self._dispatch(level, formatted_msg, args, caller_frame)
         except Exception as e:
-            self.metrics.record_error()
             final_secured_msg = secured_msg if secured_msg is not None else self._secure_message(msg)
-            failed_entry = FailedLogEntry(
-                timestamp=datetime.datetime.now(),
-                level=level,
-                message=final_secured_msg,
-                error=str(e)
+            await self._handle_log_failure(level, final_secured_msg, e)
+        finally:
+            if caller_frame:
+                del caller_frame
+
+    async def log_template(
+            self,
+            level: int,
+            template_id: str,
+            msg: str,
+            static_extras: Optional[Dict[str, Any]],
+            dynamic_field: str,
+            dynamic_value: Any
+    ) -> None:
+        """
+        Log a message from a template whose extras vary in a single field.
+
+        Writes the same line as `log(level, msg.replace("{}", str(value)),
+        extras={**static_extras, dynamic_field: dynamic_value})`, where a
+        None value leaves the field out and replaces `{}` with nothing.
+
+        The first call for a `template_id` secures `static_extras` and
+        renders them into a format string. Later calls with the same id only
+        secure `dynamic_value` (and `msg`, when it contains `{}`), skipping
+        extras sanitization, cache key construction and the extras cache.
+
+        The template is fixed on first use; later `msg` and `static_extras`
+        arguments for the same id are ignored. Templates are kept in an LRU
+        cache bounded by the same size as the extras cache.
+
+        Args:
+            level: The log severity level (e.g. logging.INFO)
+            template_id: Identifier of the template, unique per message shape
+            msg: The message, optionally containing `{}` for the dynamic value
+            static_extras: Extras that are the same on every call
+            dynamic_field: Name of the extras field that changes per call
+            dynamic_value: Value of the dynamic field for this call
+
+        Example usage:
+            await logger.log_template(
+                logging.INFO, "task_progress", "Processing task {}",
+                {"status": "running"}, "task_number", task_id
             )
-            self._failed_logs.append(failed_entry)
-            try:
-                async with self._handler_lock:
-                    self.logger.error(
-                        f"Logging failed: {str(e)} | Attempted message: {final_secured_msg}"
-                    )
-            except Exception as inner_e:
-                error_msg = (
-                    f"Logging failed at {failed_entry.timestamp.isoformat()}: {str(e)} | "
-                    f"Attempted message: {final_secured_msg}\n"
-                    f"Secondary logging error: {str(inner_e)}"
+        """
+        caller_frame = None
+        secured_msg = None
+        try:
+            if not isinstance(level, int):
+                raise ValueError("Log level must be an integer")
+            self.metrics.record_message()
+            if not self.logger.isEnabledFor(level):
+                return
+            # None values are dropped from extras, as in log(), so a None
+            # dynamic value uses a variant of the template without the field
+            cache_key = (template_id, dynamic_value is not None)
+            template = self._template_cache.get(cache_key)
+            if template is not None:
+                self._template_cache.move_to_end(cache_key)
+            else:
+                template = self._build_template(
+                    msg, static_extras, dynamic_field if dynamic_value is not None else None
                 )
-                print(error_msg, file=sys.stderr)
-
+                self._template_cache[cache_key] = template
+                if len(self._template_cache) > self._cache_size:
+                    self._template_cache.popitem(last=False)
+            message, has_placeholder, extras_fmt = template
+            if has_placeholder:
+                # Secure the whole message so spacing and control characters
+                # around the value are normalized exactly as log() does
+                value_str = '' if dynamic_value is None else str(dynamic_value)
+                message = self._secure_message(message.replace('{}', value_str))
+            secured_msg = f"{message}{extras_fmt.format(self._secure_value(dynamic_value))}"
+            try:
+                caller_frame = sys._getframe(1)
+            except ValueError:
+                caller_frame = None
+            await self._dispatch(level, secured_msg, (), caller_frame)
+        except Exception as e:
+            if secured_msg is None:
+                secured_msg = self._secure_message(msg)
+            await self._handle_log_failure(level, secured_msg, e)
         finally:
-            if frame:
-                del frame
             if caller_frame:
                 del caller_frame
 
+    def _build_template(
+            self,
+            msg: str,
+            static_extras: Optional[Dict[str, Any]],
+            dynamic_field: Optional[str]
+    ) -> Tuple[str, bool, str]:
+        """
+        Prepare a log_template message and render its extras into a format string.
+
+        A message without `{}` is secured once. Extras text is secured and
+        brace-escaped, with a `{0}` field where the dynamic value goes; the
+        dynamic field is applied last so it overrides a static key that
+        normalizes to the same name.
+
+        Args:
+            msg: The message, optionally containing `{}` for the dynamic value
+            static_extras: Extras that are the same on every call
+            dynamic_field: Name of the extras field that changes per call,
+                           or None to leave the field out
+
+        Returns:
+            Tuple[str, bool, str]: The secured message (or raw message when
+                                   it contains `{}`), whether it contains
+                                   `{}`, and the extras format string
+        """
+        def escape(text: str) -> str:
+            return text.replace('{', '{{').replace('}', '}}')
+
+        has_placeholder = isinstance(msg, str) and '{}' in msg
+        message = msg if has_placeholder else self._secure_message(msg)
+        if dynamic_field is None:
+            dynamic_key = None
+            secured_extras = self._secure_extras(static_extras)
+        else:
+            dynamic_key = _normalize_key(str(dynamic_field), self.MAX_KEY_LENGTH)
+            secured_extras = self._secure_extras({**(static_extras or {}), dynamic_field: ''})
+        if not secured_extras:
+            return message, has_placeholder, ''
+        extras_str = ", ".join(
+            f"{escape(k)}={'{0}' if k == dynamic_key else escape(v)}"
+            for k, v in secured_extras.items()
+        )
+        return message, has_placeholder, f" <bright_white>[{extras_str}]<reset>"
+
+    async def _dispatch(
+            self,
+            level: int,
+            formatted_msg: str,
+            args: Tuple[Any, ...],
+            caller_frame: Any
+    ) -> None:
+        """
+        Build a record for a secured message and hand it to the handlers.
+
+        Args:
+            level: The log severity level
+            formatted_msg: The secured message with its rendered extras
+            args: Arguments merged into the message by the formatter
+            caller_frame: Frame of the application code that logged the
+                          message, or None if it could not be determined
+        """
+        context_name = _center_context(_CONTEXT_NAME.get())
+        # Caller details are passed straight to makeRecord; findCaller is not
+        # used. Without a frame, logging's own placeholders stand in
+        if caller_frame is None:
+            filename, lineno = "(unknown file)", 0
+        else:
+            filename, lineno = caller_frame.f_code.co_filename, caller_frame.f_lineno
+        record = self.logger.makeRecord(
+            self.logger.name, level, filename, lineno,
+            formatted_msg, args, None,
+            context_name
+        )
+        # File records are batched; stream handlers get them directly
+        if self._file_handler is not None:
+            self._batch.append(record)
+            self._batch_pending.set()
+            if len(self._batch) >= self._max_pending:
+                # Backpressure: the flusher has fallen behind, write inline
+                await self._flush_batch()
+            elif len(self._batch) >= self._batch_size:
+                self._batch_full.set()
+        for handler in self._stream_handlers:
+            handler.handle(record)
+
+    async def _report_error(self, message: str) -> None:
+        """
+        Log an internal error report at ERROR level.
+
+        Reports go through `_dispatch` like any other record, so in the file
+        they land after the records already waiting in the batch instead of
+        being written ahead of them.
+
+        Args:
+            message: Description of the error
+        """
+        if self.logger.isEnabledFor(logging.ERROR):
+            await self._dispatch(
+                logging.ERROR, self._secure_message(message), (), sys._getframe(1)
+            )
+
+    async def _handle_log_failure(self, level: Any, secured_msg: str, error: Exception) -> None:
+        """
+        Record a failed logging attempt and try to report it.
+
+        Args:
+            level: The level the message was logged at
+            secured_msg: The secured message that failed to log
+            error: The exception raised while logging
+        """
+        self.metrics.record_error()
+        failed_time_ns = self._record_failed_log(level, secured_msg, str(error))
+        try:
+            await self._report_error(
+                f"Logging failed: {str(error)} | Attempted message: {secured_msg}"
+            )
+        except Exception as inner_e:
+            failed_at = datetime.datetime.fromtimestamp(failed_time_ns / 1e9).isoformat()
+            error_msg = (
+                f"Logging failed at {failed_at}: {str(error)} | "
+                f"Attempted message: {secured_msg}\n"
+                f"Secondary logging error: {str(inner_e)}"
+            )
+            print(error_msg, file=sys.stderr)
+
     async def purge_logs(
             self,
             max_age_days: Optional[int] = 30,
@@ -809,22 +1312,21 @@ class AsyncLogger:
         try:
             log_files = await self._gather_log_files(log_dir)
             stats["total_files"] = len(log_files)
-            current_date = datetime.datetime.now().date()
-            for idx, (file_path, file_date) in enumerate(log_files):
-                try:
-                    should_delete = False
-                    if max_age_days is not None and (current_date - file_date).days > max_age_days:
-                        should_delete = True
-                    if max_files is not None and idx >= max_files:
-                        should_delete = True
-                    if should_delete and not dry_run:
-                        file_path.unlink()
-                        stats["deleted_files"] += 1
-                    elif should_delete:
-                        stats["deleted_files"] += 1
-                except Exception as e:
-                    stats["errors"].append(f"Failed to process {file_path}: {str(e)}")
-                    stats["skipped_files"] += 1
+            # Files are sorted newest first, so both the age and the count
+            # criteria keep a prefix and delete everything after it
+            keep = len(log_files) if max_files is None else min(max_files, len(log_files))
+            if max_age_days is not None:
+                cutoff_date = datetime.datetime.now().date() - datetime.timedelta(days=max_age_days)
+                for idx in range(keep):
+                    if log_files[idx][1] < cutoff_date:
+                        keep = idx
+                        break
+            to_delete = [file_path for file_path, _ in log_files[keep:]]
+            failures = [] if dry_run else await asyncio.to_thread(self._unlink_files, to_delete)
+            stats["deleted_files"] = len(to_delete) - len(failures)
+            stats["skipped_files"] = len(failures)
+            for file_path, error in failures:
+                stats["errors"].append(f"Failed to process {file_path}: {str(error)}")
             return stats
         except Exception as e:
             stats["errors"].append(f"Error during log purge: {str(e)}")
@@ -848,30 +1350,68 @@ class AsyncLogger:
         if not extras or not isinstance(extras, dict):
             return ""
         try:
-            cache_key = tuple(sorted(
-                (str(k), str(v)) for k, v in extras.items() if v is not None
-            ))
+            if len(extras) == 1:
+                # Common single-field case: no generator or sort needed
+                (k, v), = extras.items()
+                cache_key = ((str(k), str(v)),) if v is not None else ()
+            else:
+                cache_key = tuple(sorted(
+                    (str(k), str(v)) for k, v in extras.items() if v is not None
+                ))
             if not cache_key:
                 return ""
-            if cache_key in self._extras_cache:
-                return self._extras_cache[cache_key]
-            if len(self._extras_cache) >= self._cache_size:
-                removal_count = max(1, self._cache_size // 4)
-                oldest_keys = list(self._extras_cache.keys())[:removal_count]
-                for key in oldest_keys:
-                    self._extras_cache.pop(key)
-            secured_extras = self._secure_extras(extras)
-            if not secured_extras:
-                return ""
-            extras_str = ", ".join(
-                f"{k}={v}" for k, v in secured_extras.items()
-            )
-            result = f" <bright_white>[{extras_str}]<reset>"
-            self._extras_cache[cache_key] = result
-            return result
+            return self._cached_extras(cache_key, self._render_extras, extras)
         except Exception as e:
             return f" [extras_error: {str(e)}]"
 
+    def _cached_extras(
+            self,
+            cache_key: Tuple[Tuple[str, str], ...],
+            compute: Callable[[Dict[str, Any]], str],
+            extras: Dict[str, Any]
+    ) -> str:
+        """
+        Look up a rendered extras string in the LRU cache, computing on a miss.
+
+        Hits are moved to the most recently used end of the cache. When the
+        cache grows past `_cache_size`, the least recently used entry is evicted.
+
+        Args:
+            cache_key: The normalized key identifying the extras
+            compute: Callable that renders the extras on a cache miss
+            extras: The dict of extra log fields passed to `compute`
+
+        Returns:
+            str: The cached or freshly rendered extras string
+        """
+        cached = self._extras_cache.get(cache_key)
+        if cached is not None:
+            self._extras_cache.move_to_end(cache_key)
+            return cached
+        result = compute(extras)
+        self._extras_cache[cache_key] = result
+        if len(self._extras_cache) > self._cache_size:
+            self._extras_cache.popitem(last=False)
+        return result
+
+    def _render_extras(self, extras: Dict[str, Any]) -> str:
+        """
+        Secure a dict of extra log fields and render it for a log line.
+
+        Args:
+            extras: The dict of extra log fields
+
+        Returns:
+            str: The formatted extras string or empty string if nothing remains
+        """
+        secured_extras = self._secure_extras(extras)
+        if not secured_extras:
+            return ""
+        extras_str = ", ".join(
+            f"{k}={v}" for k, v in secured_extras.items()
+        )
+        return f" <bright_white>[{extras_str}]<reset>"
+
     async def _setup_console_handler(
             self,
             console_format: Optional[str],
@@ -890,31 +1430,31 @@ class AsyncLogger:
         Returns:
             logging.Handler: The configured StreamHandler for console output
         """
-        async with self._handler_lock:
-            try:
-                console_handler = logging.StreamHandler(sys.stdout)
-                formatter = LogFormatter(
-                    console_format or self.default_console_format,
-                    datefmt='%Y-%m-%d %H:%M:%S',
-                    style='{',
-                    color_enabled=color_enabled,
-                    colors=colors
-                )
-                console_handler.setFormatter(formatter)
-                return console_handler
-            except Exception as e:
-                raise LoggerConfigError(f"Failed to setup console handler: {str(e)}")
+        try:
+            console_handler = logging.StreamHandler(sys.stdout)
+            formatter = LogFormatter(
+                console_format or self.default_console_format,
+                datefmt='%Y-%m-%d %H:%M:%S',
+                style='{',
+                color_enabled=color_enabled,
+                colors=colors
+            )
+            console_handler.setFormatter(formatter)
+            return console_handler
+        except Exception as e:
+            raise LoggerConfigError(f"Failed to setup console handler: {str(e)}")
 
     async def _setup_file_handler(
             self,
             log_dir: Union[str, Path],
             file_format: Optional[str],
             max_bytes: int,
-            backup_count: int
+            backup_count: int,
+            durable: bool = False
     ) -> logging.Handler:
         """
         Configure the logger's file rotation handler.
-        Creates a RotatingFileHandler to write logs to disk with size limit.
+        Creates a BatchingRotatingFileHandler to write logs to disk with size limit.
         Ensures the log directory is created and writable before logging.
 
         Args:
@@ -922,35 +1462,35 @@ class AsyncLogger:
             file_format: Message format string for log file entries
             max_bytes: Max size of log file before rotating, in bytes
             backup_count: Number of rotated log files to keep
+            durable: Open log files with O_DSYNC for crash durability
 
         Returns:
-            logging.Handler: The configured RotatingFileHandler
+            logging.Handler: The configured BatchingRotatingFileHandler
         """
         handler = None
-        async with self._handler_lock:
-            try:
-                log_dir = await self._prepare_log_directory(Path(log_dir))
-                log_file = await self._generate_log_filepath(log_dir)
-                handler = RotatingFileHandler(
-                    log_file,
-                    maxBytes=max_bytes,
-                    backupCount=backup_count,
-                    encoding='utf-8',
-                    delay=True
-                )
-                formatter = logging.Formatter(
-                    file_format or self.default_file_format,
-                    datefmt='%Y-%m-%d %H:%M:%S',
-                    style='{'
-                )
-                handler.setFormatter(formatter)
-                handler.acquire()
-                handler.release()
-                return handler
-            except Exception as e:
-                if handler:
-                    handler.close()
-                raise LoggerConfigError(f"Failed to setup file handler: {str(e)}") from e
+        try:
+            log_dir = await self._prepare_log_directory(Path(log_dir))
+            log_file = await self._generate_log_filepath(log_dir)
+            handler = BatchingRotatingFileHandler(
+                log_file,
+                maxBytes=max_bytes,
+                backupCount=backup_count,
+                encoding='utf-8',
+                delay=True,
+                durable=durable
+            )
+            formatter = logging.Formatter(
+                file_format or self.default_file_format,
+                datefmt='%Y-%m-%d %H:%M:%S',
+                style='{'
+            )
+            handler.setFormatter(formatter)
+            self._file_handler = handler
+            return handler
+        except Exception as e:
+            if handler:
+                handler.close()
+            raise LoggerConfigError(f"Failed to setup file handler: {str(e)}") from e
 
     async def _prepare_log_directory(self, log_dir: Path) -> Path:
         """
@@ -987,10 +1527,22 @@ class AsyncLogger:
             LoggerConfigError: For errors generating the file path
         """
         try:
-            log_file = log_dir / f"{datetime.datetime.now(datetime.UTC).date().isoformat()}.log"
-            if log_file.exists():
-                if not os.access(log_file, os.W_OK):
-                    raise LoggerConfigError(f"Log file {log_file} is not writable")
+            log_file = log_dir / f"{time.strftime('%Y-%m-%d', time.gmtime())}.log"
+            # One stat answers existence, ownership and current permissions
+            try:
+                file_stat = os.stat(log_file)
+            except FileNotFoundError:
+                return log_file
+            # The owner write bit only answers for files this process owns,
+            # and never for root, which can write regardless of mode bits
+            euid = os.geteuid() if hasattr(os, 'geteuid') else None
+            if euid and file_stat.st_uid == euid:
+                writable = bool(file_stat.st_mode & stat.S_IWUSR)
+            else:
+                writable = os.access(log_file, os.W_OK)
+            if not writable:
+                raise LoggerConfigError(f"Log file {log_file} is not writable")
+            if stat.S_IMODE(file_stat.st_mode) != 0o644:
                 try:
                     log_file.chmod(0o644)
                 except PermissionError as e:
@@ -1004,17 +1556,16 @@ class AsyncLogger:
 
     def _get_log_directory(self) -> Optional[Path]:
         """
-        Safely retrieve the current log directory path from logger handlers.
+        Safely retrieve the current log directory path from the file handler.
 
         Returns:
             Optional[Path]: The configured log directory if found, else None
         """
-        for handler in self.logger.handlers:
-            if isinstance(handler, RotatingFileHandler):
-                return Path(handler.baseFilename).parent
-        return None
+        if self._file_handler is None:
+            return None
+        return Path(self._file_handler.baseFilename).parent
 
-    async def _gather_log_files(self, log_dir: Path) -> List[Tuple[Path, datetime.date]]:
+    async def _gather_log_files(self, log_dir: Path) -> List[Tuple[str, datetime.date]]:
         """
         Scan and validate all log files present in the given directory.
 
@@ -1032,7 +1583,7 @@ class AsyncLogger:
             log_dir: Path to the directory containing log files to scan
 
         Returns:
-            List[Tuple[Path, datetime.date]]: List of tuples of the form
+            List[Tuple[str, datetime.date]]: List of tuples of the form
                 (log file path, creation date) for each valid log file found,
                 sorted with newest logs first.
 
@@ -1040,18 +1591,103 @@ class AsyncLogger:
             LoggerConfigError: If there is an error scanning the log directory,
                 e.g. permission issues or unexpected filename formats
         """
+        return await asyncio.to_thread(self._scan_log_files, log_dir)
+
+    @staticmethod
+    def _scan_log_files(log_dir: Path) -> List[Tuple[str, datetime.date]]:
+        """
+        Synchronously scan a directory for dated log files.
+        Runs in a worker thread on behalf of `_gather_log_files`.
+
+        Args:
+            log_dir: Path to the directory containing log files to scan
+
+        Returns:
+            List[Tuple[str, datetime.date]]: (log file path, creation date)
+                tuples sorted with newest logs first
+        """
         log_files = []
-        for file in log_dir.glob("*.log"):
-            try:
-                # Verify file is valid and accessible
-                if not file.is_file():
+        # DirEntry caches the file type from the directory read, so the
+        # is_file check normally needs no extra stat call
+        with os.scandir(log_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith('.log'):
+                    continue
+                file_date = AsyncLogger._parse_log_date(entry.name[:-4])
+                if file_date is None:
+                    continue
+                try:
+                    if entry.is_file():
+                        log_files.append((entry.path, file_date))
+                except OSError:
                     continue
-                file_date = datetime.datetime.strptime(file.stem, "%Y-%m-%d").date()
-                log_files.append((file, file_date))
-            except ValueError:
-                continue
         return sorted(log_files, key=lambda x: x[1], reverse=True)
 
+    @staticmethod
+    def _parse_log_date(name: str) -> Optional[datetime.date]:
+        """
+        Parse a 'YYYY-MM-DD' log file stem by slicing fixed positions.
+
+        Args:
+            name: The log file name without its '.log' suffix
+
+        Returns:
+            Optional[datetime.date]: The file date, or None if the name is
+                not a valid date in that format
+        """
+        if len(name) != 10 or name[4] != '-' or name[7] != '-':
+            return None
+        try:
+            return datetime.date(int(name[0:4]), int(name[5:7]), int(name[8:10]))
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _close_handlers(
+        handlers: List[logging.Handler],
+        listener: Optional[QueueListener] = None
+    ) -> None:
+        """
+        Synchronously stop the console listener and close log handlers,
+        reporting but skipping failures. Runs in a worker thread on behalf
+        of `shutdown`.
+
+        Args:
+            handlers: The detached handlers to close
+            listener: Console listener to stop (and drain) before closing
+        """
+        if listener:
+            try:
+                listener.stop()
+            except Exception as e:
+                print(f"Error stopping console listener: {str(e)}", file=sys.stderr)
+        for handler in handlers:
+            try:
+                handler.close()
+            except Exception as e:
+                print(f"Error closing handler: {str(e)}", file=sys.stderr)
+
+    @staticmethod
+    def _unlink_files(paths: List[str]) -> List[Tuple[str, Exception]]:
+        """
+        Delete a batch of files, collecting failures instead of raising.
+        Runs in a worker thread so the deletions don't block the event loop.
+
+        Args:
+            paths: Paths of the files to delete
+
+        Returns:
+            List[Tuple[str, Exception]]: The paths that could not be deleted
+                along with the error raised for each
+        """
+        failures = []
+        for path in paths:
+            try:
+                os.unlink(path)
+            except OSError as e:
+                failures.append((path, e))
+        return failures
+
     def _secure_message(self, message: Any) -> str:
         """
         Sanitize a message to guard against log injection and invalid chars.
@@ -1078,20 +1714,18 @@ class AsyncLogger:
             # Handle dictionary case with improved formatting
             if isinstance(message, dict):
                 try:
-                    formatted_items = [f"{k}={v}" for k, v in message.items()]
-                    message = f"[dict: {', '.join(formatted_items)}]"
+                    message = f"[dict: {_join_dict_items(message)}]"
                 except Exception:
                     message = '[invalid dictionary]'
             # Handle other complex types
             elif isinstance(message, (list, tuple, set)):
                 message = f"[{type(message).__name__}: {repr(message)}]"
-            # Convert to string and normalize
+            # Convert to string, replace control characters and normalize whitespace
             message = str(message)
-            # Replace control characters
-            message = message.replace('\0', ' ')
-            message = message.replace('\n', '⏎').replace('\r', '⏎')
-            # Normalize whitespace while preserving intentional spacing
-            message = ' '.join(part for part in message.split(' ') if part)
+            if len(message) <= _CACHEABLE_TEXT_LENGTH:
+                message = _normalize_short_text(message)
+            else:
+                message = _normalize_text(message)
             # Enforce length limit
             if len(message) > self.MAX_MESSAGE_LENGTH:
                 truncated_length = self.MAX_MESSAGE_LENGTH - 15
@@ -1124,12 +1758,7 @@ class AsyncLogger:
             secured = {}
             for key, value in extras.items():
                 if value is not None:
-                    safe_key = str(key)
-                    safe_key = self.UNSAFE_KEY_PATTERN.sub('_', safe_key)
-                    if safe_key.startswith('_'):
-                        safe_key = 'x' + safe_key
-                    if len(safe_key) > self.MAX_KEY_LENGTH:
-                        safe_key = safe_key[:self.MAX_KEY_LENGTH - 3] + '...'
+                    safe_key = _normalize_key(str(key), self.MAX_KEY_LENGTH)
                     secured[safe_key] = self._secure_value(value)
             return secured
         except Exception as e:
@@ -1158,8 +1787,7 @@ class AsyncLogger:
             return ''
         if isinstance(value, dict):
             try:
-                formatted_items = [f"{k}={v}" for k, v in value.items()]
-                return f"[dict: {', '.join(formatted_items)}]"
+                return f"[dict: {_join_dict_items(value)}]"
             except Exception:
                 return '[invalid dictionary]'
         if isinstance(value, (list, tuple, set)):
@@ -1169,48 +1797,157 @@ class AsyncLogger:
                 return f'[invalid {type(value).__name__}]'
         # Convert to string and apply standard security measures
         value_str = str(value)
-        value_str = value_str.replace('\0', ' ')
-        value_str = value_str.replace('\n', '⏎').replace('\r', '⏎')
-        value_str = ' '.join(part for part in value_str.split(' ') if part)
+        if len(value_str) <= _CACHEABLE_TEXT_LENGTH:
+            value_str = _normalize_short_text(value_str)
+        else:
+            value_str = _normalize_text(value_str)
         if len(value_str) > self.MAX_VALUE_LENGTH:
             value_str = f"{value_str[:self.MAX_VALUE_LENGTH - 3]}..."
         return value_str
 
     async def _periodic_flush(self) -> None:
-        """Background task that periodically flushes batched log writes."""
+        """
+        Background task that flushes batched log writes.
+
+        Sleeps without waking while the batch is empty. Once a record
+        arrives, waits up to `_flush_interval` seconds for the batch to
+        fill before flushing, so bursts are flushed as soon as they reach
+        `_batch_size` and stragglers within one interval.
+        """
         while True:
             try:
-                await asyncio.sleep(self._flush_interval)
-                if len(self._batch) > 0:  # Only flush if there are messages
-                    await self._flush_batch()
+                await self._batch_pending.wait()
+                # asyncio.wait, unlike wait_for, never swallows a cancellation
+                # that races with the batch filling up
+                batch_full = asyncio.ensure_future(self._batch_full.wait())
+                try:
+                    await asyncio.wait([batch_full], timeout=self._flush_interval)
+                finally:
+                    batch_full.cancel()
+                # Cleared before the flush swaps the batch out; records logged
+                # after the swap set the events again for the next round
+                self._batch_pending.clear()
+                self._batch_full.clear()
+                await self._flush_batch()
             except Exception as e:
                 self.metrics.record_error()
                 if self.logger:  # Add this check
-                    self.logger.error(f"Flush error: {str(e)}")
+                    await self._report_error(f"Flush error: {str(e)}")
                 else:
                     print(f"Flush error: {str(e)}", file=sys.stderr)
 
     async def _flush_batch(self) -> None:
         """Immediately write any buffered log messages to disk."""
-        async with self._handler_lock:
-            if self._batch:
-                try:
-                    for handler in self.logger.handlers:
-                        if isinstance(handler, RotatingFileHandler):
-                            for record in self._batch:
-                                handler.emit(record)
-                    self._batch.clear()
-                    self._last_flush = time.time()
-                except Exception as e:
-                    self.metrics.record_error()
-                    if self.logger:
-                        self.logger.error(f"Batch flush failed: {str(e)}")
-
-    async def get_failed_logs(self) -> List[FailedLogEntry]:
-        """Retrieve all failed log messages that could not be logged."""
-        return list(self._failed_logs)
-
-    async def get_health_status(self) -> Dict[str, Any]:
+        if self._batch:
+            try:
+                # Hand the filled deque to the writer and start a fresh one
+                records, self._batch = self._batch, deque(maxlen=self._batch.maxlen)
+                if self._file_handler is not None:
+                    if self._file_handler.durable:
+                        # Synchronous data writes wait on the device, so they
+                        # run in a worker thread instead of stalling the loop
+                        async with self._write_lock:
+                            await asyncio.to_thread(self._file_handler.emit_many, records)
+                    else:
+                        self._file_handler.emit_many(records)
+                self._last_flush = time.monotonic()
+            except Exception as e:
+                self.metrics.record_error()
+                if self.logger:
+                    await self._report_error(f"Batch flush failed: {str(e)}")
+
+    def _record_failed_log(self, level: Any, message: str, error: str) -> int:
+        """
+        Store a failed logging attempt in the failed log ring buffer.
+
+        Overwrites the oldest slot once the buffer is full. Only the raw
+        fields are stored; no FailedLogEntry or datetime is allocated.
+
+        Args:
+            level: The level the message was logged at
+            message: The secured message that failed to log
+            error: Description of the error that prevented logging
+
+        Returns:
+            int: The failure timestamp in nanoseconds since the epoch
+        """
+        slot = self._failed_count % self._failed_logs_size
+        timestamp_ns = time.time_ns()
+        self._failed_timestamps[slot] = timestamp_ns
+        self._failed_levels[slot] = level
+        self._failed_messages[slot] = message
+        self._failed_errors[slot] = error
+        self._failed_count += 1
+        return timestamp_ns
+
+    def get_failed_logs(self, limit: Optional[int] = None) -> Tuple[FailedLogEntry, ...]:
+        """
+        Retrieve failed log messages that could not be logged, oldest first.
+
+        Entries are built from the ring buffer on each call, so passing a
+        small `limit` keeps inspecting recent failures cheap.
+
+        Args:
+            limit: Only return the newest `limit` entries, or all if None
+
+        Returns:
+            Tuple[FailedLogEntry, ...]: The retained failed log entries
+        """
+        size = self._failed_logs_size
+        retained = min(self._failed_count, size)
+        if limit is not None:
+            retained = min(retained, max(limit, 0))
+        slots = [index % size for index in range(self._failed_count - retained, self._failed_count)]
+        return tuple(
+            FailedLogEntry(
+                timestamp=datetime.datetime.fromtimestamp(self._failed_timestamps[slot] / 1e9),
+                level=self._failed_levels[slot],
+                message=self._failed_messages[slot],
+                error=self._failed_errors[slot]
+            )
+            for slot in slots
+        )
+
+    async def flush(self) -> None:
+        """
+        Write any batched file records to disk now.
+
+        The periodic flush task writes batches on its own; call this when
+        records must be on disk before continuing, e.g. before reading the
+        log file back.
+
+        Example usage:
+            await logger.info("Checkpoint reached")
+            await logger.flush()
+        """
+        await self._flush_batch()
+
+    async def reset(self) -> None:
+        """
+        Return the logger to its freshly created state, keeping its handlers.
+
+        Batched records are flushed first so none are lost. Then the metrics
+        are zeroed, the failed log entries are cleared, and the extras and
+        template caches are emptied, so nothing from earlier logging shows
+        up in `get_health_status` or `get_failed_logs` afterwards. The
+        logger's level and configuration are left unchanged.
+
+        Example usage:
+            await logger.reset()
+            assert logger.get_health_status()["total_messages"] == 0
+        """
+        await self._flush_batch()
+        self.metrics = LoggerMetrics()
+        self._failed_count = 0
+        for slot in range(self._failed_logs_size):
+            self._failed_timestamps[slot] = 0
+            self._failed_levels[slot] = None
+            self._failed_messages[slot] = None
+            self._failed_errors[slot] = None
+        self._extras_cache.clear()
+        self._template_cache.clear()
+
+    def get_health_status(self) -> Dict[str, Any]:
         """
         Get a snapshot of internal logger state and metrics.
 
@@ -1239,6 +1976,10 @@ class AsyncLogger:
         - extras_cache_size: Number of keys in the extras cache. Can be used
           to monitor memory usage and identify any unexpected growth over time.
 
+        - template_cache_size: Number of prerendered log_template templates.
+          Bounded like the extras cache; steady growth suggests template ids
+          that are not reused.
+
         Returns:
             Dict[str, Any]: Logger state and metrics
         """
@@ -1247,9 +1988,10 @@ class AsyncLogger:
             "error_count": self.metrics.error_count,
             "last_error_time": self.metrics.last_error_time,
             "batch_size": len(self._batch),
-            "time_since_flush": time.time() - self._last_flush,
-            "failed_logs_count": len(self._failed_logs),
-            "extras_cache_size": len(self._extras_cache)
+            "time_since_flush": time.monotonic() - self._last_flush,
+            "failed_logs_count": min(self._failed_count, self._failed_logs_size),
+            "extras_cache_size": len(self._extras_cache),
+            "template_cache_size": len(self._template_cache)
         }
 
     async def shutdown(self) -> None:
@@ -1257,7 +1999,7 @@ class AsyncLogger:
         Cleanly shut down the logger.
 
         Flushes any pending writes, cancels periodic flush task,
-        closes all log handlers, and releases locks.
+        stops the console listener thread, and closes all log handlers.
 
         Should be called before application exit.
         """
@@ -1266,26 +2008,36 @@ class AsyncLogger:
             await self._flush_batch()
             if self._flush_task:
                 self._flush_task.cancel()
-            async with self._handler_lock:
-                if self.logger and self.logger.handlers:
-                    handlers_copy = self.logger.handlers[:]
-                    for handler in handlers_copy:
-                        try:
-                            handler.close()
-                            self.logger.removeHandler(handler)
-                        except Exception as e:
-                            print(f"Error closing handler: {str(e)}", file=sys.stderr)
-                    self.logger = None
+                # Let the task process its cancellation before handlers close
+                await asyncio.wait([self._flush_task])
+            # Detach every handler first so nothing can reach them while closing
+            handlers = []
+            if self.logger:
+                handlers.extend(self.logger.handlers)
+                for handler in handlers:
+                    self.logger.removeHandler(handler)
+                self.logger = None
+            self._file_handler = None
+            self._stream_handlers = []
+            listener = self._listener
+            if listener:
+                handlers.extend(listener.handlers)
+                self._listener = None
+            # Stopping the listener joins its thread after draining queued
+            # console records, and closing flushes and releases files, so
+            # both stay off the event loop
+            await asyncio.to_thread(self._close_handlers, handlers, listener)
         except Exception as e:
             print(f"Error during logger shutdown: {str(e)}", file=sys.stderr)
 
 
 async def process_task(logger: AsyncLogger, task_id: int):
     """Mock function demonstrating async logger in an async context."""
-    await logger.info(
-        f"Processing task {task_id}",
-        extras={"task_number": task_id, "status": "running"}
-    )
+    with logger.context(f"Task-{task_id}"):
+        await logger.log_template(
+            logging.INFO, "process_task", "Processing task {}",
+            {"status": "running"}, "task_number", task_id
+        )
 
 
 async def example():
@@ -1361,4 +2113,9 @@ async def example():
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     asyncio.run(example())
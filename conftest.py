@@ -0,0 +1,15 @@
+import asyncio
+import pytest
+
+
+# Only pytest-asyncio 1.4+ (Python 3.10+) defines this hook; optionalhook lets
+# older releases, such as the ones Python 3.9 installs, ignore it and use their
+# default loop
+@pytest.hookimpl(optionalhook=True)
+def pytest_asyncio_loop_factories(config, item):
+    """Run the test event loop on uvloop if installed."""
+    try:
+        import uvloop
+        return {"uvloop": uvloop.new_event_loop}
+    except ImportError:
+        return {"asyncio": asyncio.new_event_loop}
@@ -1,63 +1,72 @@
+import os
 import pytest
+import pytest_asyncio
 import asyncio
 import logging
+import datetime
 import tempfile
 from pathlib import Path
-from . import AsyncLogger
+from . import AsyncLogger, BatchingRotatingFileHandler
 
 
-@pytest.fixture(scope="function")
-def event_loop():
-    """Create an event loop for each test case."""
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    yield loop
-    loop.close()
+# Static extras payload shared by tests instead of rebuilt per call
+_EXTRAS = {"test_key": "test_value"}
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def test_dir():
-    """Create a temporary directory for test logs."""
-    with tempfile.TemporaryDirectory() as temp_dir:
+    """Create a temporary directory for test logs, memory-backed where available."""
+    shm_dir = "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
+    with tempfile.TemporaryDirectory(dir=shm_dir) as temp_dir:
         yield temp_dir
 
 
-@pytest.fixture
-def logger(test_dir, event_loop):
-    """Create a logger instance for testing."""
-    logger_instance = event_loop.run_until_complete(
-        AsyncLogger.create(
-            name="test_logger",
-            log_dir=Path(test_dir),
-            level=logging.DEBUG
-        )
+@pytest_asyncio.fixture(scope="module")
+async def shared_logger(test_dir):
+    """Create one logger instance shared by the tests in this module."""
+    logger_instance = await AsyncLogger.create(
+        name="test_logger",
+        log_dir=Path(test_dir),
+        level=logging.DEBUG
     )
     yield logger_instance
-    event_loop.run_until_complete(logger_instance.shutdown())
+    await logger_instance.shutdown()
+
+
+@pytest_asyncio.fixture
+async def logger(shared_logger):
+    """Reset the shared logger's state and level before each test."""
+    await shared_logger.reset()
+    shared_logger.logger.setLevel(logging.DEBUG)
+    return shared_logger
 
 
 @pytest.mark.asyncio
-async def test_logger_creation(logger: AsyncLogger):
+async def test_logger_creation():
     """Test basic logger creation and initialization."""
+    logger = AsyncLogger.create_no_io(name="test_logger_no_io")
     assert logger is not None
-    assert logger.logger.name == "test_logger"
+    assert logger.logger.name == "test_logger_no_io"
     assert len(logger.logger.handlers) > 0
+    await logger.shutdown()
 
 
 @pytest.mark.asyncio
-async def test_basic_logging(logger: AsyncLogger):
+async def test_basic_logging(logger: AsyncLogger, test_dir):
     """Test basic logging functionality."""
     message = "Test log message"
     await logger.info(message)
     assert logger.metrics.total_messages == 1
     assert logger.metrics.error_count == 0
+    await logger.flush()
+    log_file = next(Path(test_dir).iterdir())
+    assert log_file.read_text().splitlines()[-1].endswith(message)
 
 
 @pytest.mark.asyncio
 async def test_logging_with_extras(logger: AsyncLogger):
     """Test logging with extra fields."""
-    extras = {"test_key": "test_value"}
-    await logger.info("Test message", extras=extras)
+    await logger.info("Test message", extras=_EXTRAS)
     assert logger.metrics.total_messages == 1
 
 
@@ -68,19 +77,229 @@ async def test_error_handling(logger: AsyncLogger):
     # Check that an error was recorded
     assert logger.metrics.error_count == 1
     # Verify that there are failed log entries
-    failed_logs = await logger.get_failed_logs()
-    assert len(failed_logs) > 0
+    failed_logs = logger.get_failed_logs(limit=1)
+    assert len(failed_logs) == 1
     # Optional: Check the content of the failed log entry
     assert failed_logs[-1].message == '[empty message]'
 
 
+@pytest.mark.asyncio
+async def test_reset(logger: AsyncLogger, test_dir):
+    """Test reset flushes pending records and clears metrics, failures and caches."""
+    await logger.info("Before reset", extras=_EXTRAS)
+    await logger.log_template(logging.INFO, "reset", "Task {}", None, "task", 1)
+    await logger.log(None, "Invalid level")
+    await logger.reset()
+    log_file = next(Path(test_dir).iterdir())
+    assert "Before reset" in log_file.read_text()
+    status = logger.get_health_status()
+    assert status["total_messages"] == 0
+    assert status["error_count"] == 0
+    assert status["last_error_time"] is None
+    assert status["batch_size"] == 0
+    assert status["failed_logs_count"] == 0
+    assert status["extras_cache_size"] == 0
+    assert status["template_cache_size"] == 0
+    assert logger.get_failed_logs() == ()
+
+
+@pytest.mark.asyncio
+async def test_failed_logs_ring_buffer():
+    """Test the failed log buffer keeps the newest entries and clamps limits."""
+    ring_logger = AsyncLogger.create_no_io(name="test_failed_ring")
+    for index in range(250):
+        await ring_logger.log("invalid", f"m{index}")  # Non-int level fails
+    assert ring_logger.metrics.error_count == 250
+    failed_logs = ring_logger.get_failed_logs()
+    assert [entry.message for entry in failed_logs] == [f"m{index}" for index in range(150, 250)]
+    assert [entry.message for entry in ring_logger.get_failed_logs(limit=2)] == ["m248", "m249"]
+    assert ring_logger.get_failed_logs(limit=0) == ()
+    assert ring_logger.get_failed_logs(limit=-5) == ()
+    assert len(ring_logger.get_failed_logs(limit=1000)) == 100
+    await ring_logger.shutdown()
+
+
 @pytest.mark.asyncio
 async def test_invalid_level_handling(logger: AsyncLogger):
-    """Test handling of invalid log levels."""
+    """Test levels below the logger's level are counted but not written."""
     await logger.log(-1, "Invalid level")
     assert logger.metrics.total_messages == 1
-    # Verify the message was logged despite invalid level
-    assert len(logger.logger.handlers) > 0
+    assert logger.metrics.error_count == 0
+    # The message is filtered out before reaching any handler
+    assert logger.get_health_status()["batch_size"] == 0
+
+
+@pytest.mark.asyncio
+async def test_failure_report_order(logger: AsyncLogger, test_dir):
+    """Test failure reports are written after records already batched."""
+    await logger.info("Logged before the failure")
+    await logger.log("INFO", "Bad level type")
+    assert logger.metrics.error_count == 1
+    await logger.flush()
+    log_file = next(Path(test_dir).iterdir())
+    last_lines = log_file.read_text().splitlines()[-2:]
+    assert last_lines[0].endswith("Logged before the failure")
+    assert "Logging failed: Log level must be an integer" in last_lines[1]
+
+
+@pytest.mark.asyncio
+async def test_disabled_level_skipped(logger: AsyncLogger):
+    """Test messages below the logger level are not queued for output."""
+    logger.logger.setLevel(logging.WARNING)
+    await logger.debug("Filtered message")
+    status = logger.get_health_status()
+    assert status["batch_size"] == 0
+    assert logger.metrics.error_count == 0
+    # A None message is still recorded as a failure on a filtered level
+    await logger.debug(None)
+    assert logger.metrics.error_count == 1
+    assert logger.get_failed_logs(limit=1)[0].message == '[empty message]'
+
+
+@pytest.mark.asyncio
+async def test_log_template(tmp_path: Path):
+    """Test templated messages write the same line as log() and reuse the template."""
+    template_logger = await AsyncLogger.create(name="test_template", log_dir=tmp_path)
+    # (template id, message, static extras, dynamic value), including a value
+    # that needs normalizing and a static key colliding with the dynamic one
+    cases = [
+        ("task", "Processing task {}", {"status": "running"}, 1),
+        ("task", "Processing task {}", {"status": "running"}, "  two\n  lines "),
+        ("task", "Processing task {}", {"status": "running"}, None),
+        ("clash", "Task {} done", {"task number": "stale", "status": "ok"}, 3),
+        ("static", "No placeholder", {"status": "idle"}, 4),
+    ]
+    for template_id, msg, static_extras, value in cases:
+        await template_logger.log_template(
+            logging.INFO, template_id, msg, static_extras, "task_number", value
+        )
+        await template_logger.info(
+            msg.replace("{}", "" if value is None else str(value)),
+            extras={**static_extras, "task_number": value}
+        )
+    status = template_logger.get_health_status()
+    assert status["total_messages"] == 2 * len(cases)
+    # One template per id, plus the variant for a None value
+    assert status["template_cache_size"] == 4
+    await template_logger.shutdown()
+    messages = [
+        line.split("test_template", 1)[1].strip()
+        for line in next(tmp_path.iterdir()).read_text().splitlines()
+    ]
+    assert messages[0::2] == messages[1::2]
+    assert messages[4] == "Processing task <bright_white>[status=running]<reset>"
+
+
+@pytest.mark.asyncio
+async def test_rotation_respects_max_bytes(tmp_path: Path):
+    """Test batched writes roll over so no log file exceeds max_bytes."""
+    rotating_logger = await AsyncLogger.create(
+        name="test_rotation",
+        log_dir=tmp_path,
+        max_bytes=2000,
+        backup_count=50
+    )
+    # A burst larger than several files, then bursts picked up by the flusher
+    for burst, count in enumerate((300, 150, 150)):
+        for index in range(count):
+            await rotating_logger.info(f"Burst {burst} message {index}")
+        await asyncio.sleep(0.01)
+    await rotating_logger.shutdown()
+    log_files = list(tmp_path.iterdir())
+    assert len(log_files) > 1
+    assert all(file.stat().st_size < 2000 for file in log_files)
+    assert sum(file.read_text().count("\n") for file in log_files) == 600
+
+
+def test_rollover_skips_empty_file(tmp_path: Path):
+    """Test an oversized first record is written without creating empty backups."""
+    log_file = tmp_path / "app.log"
+    handler = BatchingRotatingFileHandler(log_file, maxBytes=100, backupCount=3)
+    handler.setFormatter(logging.Formatter("{message}", style="{"))
+    for index in range(2):
+        handler.emit(logging.makeLogRecord({"msg": f"{index}" * 300}))
+    handler.close()
+    assert sorted(file.name for file in tmp_path.iterdir()) == ["app.log", "app.log.1"]
+    assert (tmp_path / "app.log.1").read_text() == "0" * 300 + "\n"
+    assert log_file.read_text() == "1" * 300 + "\n"
+
+
+def test_rollover_bounds_format_overhead(tmp_path: Path):
+    """Test format fields much longer than the message still respect maxBytes."""
+    handler = BatchingRotatingFileHandler(tmp_path / "app.log", maxBytes=10000, backupCount=20)
+    handler.setFormatter(logging.Formatter("{name} {message}", style="{"))
+    for index in range(10):
+        handler.emit(logging.makeLogRecord({"name": "n" * 2000, "msg": f"message {index}"}))
+    handler.close()
+    log_files = list(tmp_path.iterdir())
+    assert len(log_files) > 1
+    assert all(file.stat().st_size < 10000 for file in log_files)
+    assert sum(file.read_text().count("\n") for file in log_files) == 10
+
+
+@pytest.mark.asyncio
+async def test_durable_logging(tmp_path: Path):
+    """Test a durable logger writes every record to its log file."""
+    durable_logger = await AsyncLogger.create(
+        name="test_durable",
+        log_dir=tmp_path,
+        durable=True
+    )
+    for index in range(250):
+        await durable_logger.info(f"Durable message {index}")
+    await asyncio.sleep(0.01)
+    await durable_logger.shutdown()
+    log_files = list(tmp_path.iterdir())
+    assert len(log_files) == 1
+    lines = log_files[0].read_text().splitlines()
+    assert [line.rsplit(" ", 1)[-1] for line in lines] == [str(index) for index in range(250)]
+
+
+@pytest_asyncio.fixture
+async def purge_logger(tmp_path: Path):
+    """Create a logger over a directory of dated logs 0, 3, ... 27 days old plus non-log entries."""
+    today = datetime.date.today()
+    for age in range(0, 30, 3):
+        (tmp_path / f"{today - datetime.timedelta(days=age)}.log").write_text("entry\n")
+    (tmp_path / "notes.log").write_text("not dated\n")
+    (tmp_path / "2020-01-01.log.1").write_text("rotated backup\n")
+    (tmp_path / "2020-01-02.log").mkdir()
+    logger_instance = await AsyncLogger.create(name="test_purge", log_dir=tmp_path)
+    yield logger_instance
+    await logger_instance.shutdown()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("max_age_days, max_files, expected_deleted", [
+    (10, None, 6),  # Age only: 12 days and older
+    (None, 2, 8),  # Count only: all but the two newest
+    (20, 5, 5),  # Combined: the count limit is the stricter one
+    (20, 9, 3),  # Combined: the age limit is the stricter one
+    (None, None, 0),
+])
+async def test_purge_logs_dry_run(purge_logger: AsyncLogger, tmp_path: Path,
+                                  max_age_days, max_files, expected_deleted):
+    """Test purge retention rules in dry run mode, which deletes nothing."""
+    stats = await purge_logger.purge_logs(
+        max_age_days=max_age_days, max_files=max_files, dry_run=True
+    )
+    # Only date-named regular files are considered
+    assert stats["total_files"] == 10
+    assert stats["deleted_files"] == expected_deleted
+    assert stats["errors"] == []
+    assert len(list(tmp_path.iterdir())) == 13
+
+
+@pytest.mark.asyncio
+async def test_purge_logs(purge_logger: AsyncLogger, tmp_path: Path):
+    """Test purging deletes the oldest dated logs and leaves other entries alone."""
+    stats = await purge_logger.purge_logs(max_age_days=20, max_files=5)
+    assert stats["deleted_files"] == 5
+    assert stats["skipped_files"] == 0
+    today = datetime.date.today()
+    expected = {f"{today - datetime.timedelta(days=age)}.log" for age in range(0, 15, 3)}
+    expected |= {"notes.log", "2020-01-01.log.1", "2020-01-02.log"}
+    assert {entry.name for entry in tmp_path.iterdir()} == expected
 
 
 if __name__ == "__main__":